@@ -1,5 +1,6 @@
 """Configuration management for Splunk MCP Bridge."""
 
+import functools
 from typing import List, Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -33,6 +34,12 @@ class Settings(BaseSettings):
     # Bridge Security Configuration
     bridge_api_key: Optional[str] = Field(default=None, description="API Key for securing bridge endpoints")
 
+    # Health Check Configuration
+    bridge_health_cache_ttl: float = Field(
+        default=10.0,
+        description="Seconds a successful MCP call counts as proof of liveness for /health",
+    )
+
     # Logging Configuration
     log_level: str = Field(default="INFO", description="Logging level")
     bridge_log_payloads: bool = Field(
@@ -46,9 +53,9 @@ class Settings(BaseSettings):
         description="Comma-separated list of allowed CORS origins",
     )
 
-    @property
+    @functools.cached_property
     def cors_origins_list(self) -> List[str]:
-        """Parse CORS origins from comma-separated string."""
+        """Parse CORS origins from comma-separated string (computed once)."""
         if self.cors_origins == "*":
             return ["*"]
         return [origin.strip() for origin in self.cors_origins.split(",")]
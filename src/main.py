@@ -4,18 +4,22 @@ import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+import httpx
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from src.config import settings
-from src.mcp_client import mcp_client
+from src.mcp_client import mcp_client, MCPError
 from src.routers import tools_router, resources_router
 from src.middleware import (
     http_exception_handler,
     validation_exception_handler,
-    general_exception_handler,
+    mcp_error_handler,
+    httpx_timeout_handler,
+    httpx_error_handler,
     RequestLoggingMiddleware,
 )
 from src.middleware.auth_middleware import get_api_key
@@ -42,15 +46,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     # Startup
     logger.info("Starting Splunk MCP Bridge...")
     logger.info(f"Bridge service running on {settings.bridge_host}:{settings.bridge_port}")
-    logger.info(f"Connecting to Splunk MCP Server at {settings.splunk_mcp_server_url}")
-    
-    try:
-        await mcp_client.connect()
-        logger.info("Successfully connected to Splunk MCP Server")
-    except Exception as e:
-        logger.error(f"Failed to connect to MCP server: {e}")
-        logger.warning("Bridge will attempt to connect on first request")
-    
+    logger.info(f"Splunk MCP Server target: {settings.splunk_mcp_server_url}")
+    logger.info("MCP connection will be established lazily on first request")
+
     yield
     
     # Shutdown
@@ -65,6 +63,7 @@ app = FastAPI(
     description="REST API bridge for Power Automate Desktop to Splunk MCP Server",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -76,17 +75,25 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Register request logging middleware
-app.add_middleware(RequestLoggingMiddleware)
+# Register request logging middleware only when payload auditing is enabled,
+# so the disabled path skips the middleware hop entirely
+if settings.bridge_log_payloads:
+    app.add_middleware(RequestLoggingMiddleware)
 
-# Register exception handlers
+# Register exception handlers. Handlers are keyed on specific exception
+# types rather than a blanket Exception so Starlette resolves them by type
+# lookup and programmer errors surface normally.
 app.add_exception_handler(StarletteHTTPException, http_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
-app.add_exception_handler(Exception, general_exception_handler)
+app.add_exception_handler(MCPError, mcp_error_handler)
+app.add_exception_handler(httpx.TimeoutException, httpx_timeout_handler)
+app.add_exception_handler(httpx.HTTPError, httpx_error_handler)
 
-# Register routers
-app.include_router(tools_router, dependencies=[Depends(get_api_key)])
-app.include_router(resources_router, dependencies=[Depends(get_api_key)])
+# Register routers. The auth dependency is attached only when an API key is
+# configured, so the no-auth path pays no per-request dependency resolution.
+_auth_deps = [Depends(get_api_key)] if settings.bridge_api_key else []
+app.include_router(tools_router, dependencies=_auth_deps)
+app.include_router(resources_router, dependencies=_auth_deps)
 
 
 @app.get("/")
@@ -104,8 +111,8 @@ async def root():
 async def health_check():
     """Health check endpoint."""
     try:
-        # Try to list tools to verify MCP connection
-        await mcp_client.list_tools()
+        # Cheap liveness check: cached recent success or a lightweight MCP ping
+        await mcp_client.ping()
         return {
             "status": "healthy",
             "mcp_connection": "connected",
@@ -120,12 +127,16 @@ async def health_check():
 
 
 if __name__ == "__main__":
+    import os
     import uvicorn
-    
+
     uvicorn.run(
         "src.main:app",
         host=settings.bridge_host,
         port=settings.bridge_port,
-        reload=True,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("BRIDGE_WORKERS", "1")),
+        reload=os.getenv("BRIDGE_RELOAD") == "1",
         log_level=settings.log_level.lower(),
     )
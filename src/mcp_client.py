@@ -1,9 +1,11 @@
 """MCP Client for connecting to Splunk MCP Server."""
 
-import json
+import asyncio
 import logging
+import time
 from typing import Any, Dict, List, Optional
 import httpx
+import orjson
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
@@ -11,6 +13,23 @@ from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Cached at import so _send_request avoids pydantic attribute lookups per call.
+_SERVER_URL = settings.splunk_mcp_server_url
+_LOG_PAYLOADS = settings.bridge_log_payloads
+
+# Shared empty-params singleton for methods that take no arguments
+_EMPTY_PARAMS: Dict[str, Any] = {}
+
+# SSL context built once per process: loading the CA bundle costs tens of
+# milliseconds, so reconnects reuse this instead of rebuilding it. ALPN is
+# set explicitly to advertise h2 + http/1.1 for HTTP/2 negotiation.
+_SSL_CTX = httpx.create_ssl_context(verify=settings.splunk_mcp_server_verify_ssl)
+_SSL_CTX.set_alpn_protocols(["h2", "http/1.1"])
+
+
+class MCPError(Exception):
+    """Raised when the MCP server returns a JSON-RPC error response."""
+
 
 class MCPClient:
     """Client for interacting with Splunk MCP Server via HTTP."""
@@ -22,25 +41,41 @@ class MCPClient:
         self.timeout = settings.splunk_mcp_server_timeout
         self.session: Optional[ClientSession] = None
         self._http_client: Optional[httpx.AsyncClient] = None
+        self._connect_lock = asyncio.Lock()
+        self._last_success = 0.0
 
     async def connect(self) -> None:
-        """Establish connection to MCP server."""
+        """Establish connection to MCP server. Idempotent if already connected."""
+        if self._http_client is not None:
+            return
         try:
-            logger.info(f"Connecting to Splunk MCP Server at {self.server_url}")
+            logger.info("Connecting to Splunk MCP Server at %s", self.server_url)
             
-            headers = {}
+            headers = {"Content-Type": "application/json"}
             if self.auth_token:
                 logger.info("Using Bearer token authentication")
                 headers["Authorization"] = f"Bearer {self.auth_token}"
             
-            # Create HTTP client for MCP communication
-            verify_ssl = settings.splunk_mcp_server_verify_ssl
-            
+            # Persistent pooled connections with HTTP/2 multiplexing so
+            # concurrent bridge requests share sockets instead of paying a
+            # TCP/TLS handshake per JSON-RPC call
+            limits = httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50,
+                keepalive_expiry=30.0,
+            )
+            transport = httpx.AsyncHTTPTransport(
+                retries=1,
+                http2=True,
+                limits=limits,
+                verify=_SSL_CTX,
+            )
+
             self._http_client = httpx.AsyncClient(
                 base_url=self.server_url,
                 timeout=self.timeout,
                 headers=headers,
-                verify=verify_ssl,
+                transport=transport,
             )
             
             # Initialize MCP session
@@ -49,7 +84,7 @@ class MCPClient:
             
             logger.info("Successfully connected to Splunk MCP Server")
         except Exception as e:
-            logger.error(f"Failed to connect to MCP server: {e}")
+            logger.error("Failed to connect to MCP server: %s", e)
             raise
 
     async def disconnect(self) -> None:
@@ -61,8 +96,12 @@ class MCPClient:
 
     async def _send_request(self, method: str, params: Dict[str, Any], request_id: int) -> Dict[str, Any]:
         """Send a JSON-RPC request to the MCP server with auditing."""
-        if not self._http_client:
-            await self.connect()
+        if self._http_client is None:
+            # Single-flight connect: only one coroutine builds the client,
+            # the rest wait on the lock and see it already set
+            async with self._connect_lock:
+                if self._http_client is None:
+                    await self.connect()
 
         payload = {
             "jsonrpc": "2.0",
@@ -71,79 +110,175 @@ class MCPClient:
             "params": params,
         }
 
-        if settings.bridge_log_payloads:
+        if _LOG_PAYLOADS and logger.isEnabledFor(logging.INFO):
             logger.info(
                 f"[AUDIT] Calling Splunk MCP: {method}\n"
-                f"URL: {self.server_url}\n"
-                f"Payload: {json.dumps(payload, indent=2)}"
+                f"URL: {_SERVER_URL}\n"
+                f"Payload: {orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()}"
             )
 
-        response = await self._http_client.post("/", json=payload)
+        # Pre-serialize with orjson and post raw bytes, bypassing httpx's
+        # internal stdlib json.dumps and per-call header construction
+        response = await self._http_client.post("/", content=orjson.dumps(payload))
         
-        if settings.bridge_log_payloads:
+        if _LOG_PAYLOADS and logger.isEnabledFor(logging.INFO):
             try:
-                result = response.json()
-                resp_log = json.dumps(result, indent=2)
-            except Exception:
-                result = {"error": "Non-JSON response from Splunk", "raw": response.text}
+                resp_log = orjson.dumps(
+                    orjson.loads(response.content), option=orjson.OPT_INDENT_2
+                ).decode()
+            except orjson.JSONDecodeError:
                 resp_log = response.text
-                
+
             logger.info(
                 f"[AUDIT] Splunk MCP Response: {method} - Status: {response.status_code}\n"
                 f"Response: {resp_log}"
             )
-        else:
-            result = response.json()
 
+        # Raise before parsing so a 5xx with an HTML/plain-text error page
+        # surfaces as httpx.HTTPStatusError (cheap logging path) instead of
+        # a JSON decode error
         response.raise_for_status()
 
+        try:
+            result = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            raise MCPError(f"Non-JSON response from Splunk: {response.text}")
+
         if "error" in result:
-            raise Exception(f"MCP error: {result['error']}")
-        
+            raise MCPError(f"MCP error: {result['error']}")
+
+        self._last_success = time.monotonic()
         return result.get("result", {})
 
+    async def batch(self, requests: List[tuple]) -> List[Dict[str, Any]]:
+        """Send several JSON-RPC calls as one batch request.
+
+        Args:
+            requests: (method, params, request_id) tuples
+
+        Returns:
+            Per-call results ordered to match the input, resolved by id.
+
+        The JSON-RPC spec allows posting an array of request objects, so
+        independent calls share one TCP write and one response parse
+        instead of a round-trip each.
+        """
+        if self._http_client is None:
+            async with self._connect_lock:
+                if self._http_client is None:
+                    await self.connect()
+
+        payload = [
+            {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+            for method, params, request_id in requests
+        ]
+
+        if _LOG_PAYLOADS and logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"[AUDIT] Calling Splunk MCP batch ({len(payload)} requests)\n"
+                f"URL: {_SERVER_URL}\n"
+                f"Payload: {orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()}"
+            )
+
+        response = await self._http_client.post("/", content=orjson.dumps(payload))
+        # Raise before parsing so a 5xx with a non-JSON error page surfaces
+        # as httpx.HTTPStatusError instead of a JSON decode error
+        response.raise_for_status()
+        responses = orjson.loads(response.content)
+
+        if _LOG_PAYLOADS and logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"[AUDIT] Splunk MCP batch response - Status: {response.status_code}\n"
+                f"Response: {orjson.dumps(responses, option=orjson.OPT_INDENT_2).decode()}"
+            )
+
+        # The spec mandates a single error object (not an array) for an
+        # invalid batch request
+        if not isinstance(responses, list):
+            if isinstance(responses, dict) and "error" in responses:
+                raise MCPError(f"MCP error: {responses['error']}")
+            raise MCPError(f"MCP batch response is not an array: {responses!r}")
+
+        by_id = {item.get("id"): item for item in responses}
+        results = []
+        for method, _, request_id in requests:
+            item = by_id.get(request_id)
+            if item is None:
+                raise MCPError(f"MCP batch response missing id {request_id} for {method}")
+            if "error" in item:
+                raise MCPError(f"MCP error: {item['error']}")
+            results.append(item.get("result", {}))
+
+        self._last_success = time.monotonic()
+        return results
+
+    async def ping(self) -> None:
+        """Verify MCP server liveness cheaply.
+
+        A successful call within the last bridge_health_cache_ttl seconds
+        counts as proof of liveness; otherwise send a lightweight JSON-RPC
+        ping instead of a full tools/list roundtrip.
+        """
+        if time.monotonic() - self._last_success < settings.bridge_health_cache_ttl:
+            return
+        await self._send_request("ping", _EMPTY_PARAMS, 0)
+
     async def list_tools(self) -> List[Dict[str, Any]]:
         """List available tools from MCP server."""
         try:
-            result = await self._send_request("tools/list", {}, 1)
+            result = await self._send_request("tools/list", _EMPTY_PARAMS, 1)
             tools = result.get("tools", [])
-            logger.info(f"Retrieved {len(tools)} tools from MCP server")
+            logger.info("Retrieved %d tools from MCP server", len(tools))
             return tools
-        except Exception as e:
-            logger.error(f"Failed to list tools from {self.server_url}: {str(e)}", exc_info=True)
+        except (httpx.HTTPError, MCPError) as e:
+            # Common upstream failures: the message suffices, skip the
+            # cost of formatting a full traceback
+            logger.error("Failed to list tools from %s: %s", self.server_url, e)
+            raise
+        except Exception:
+            logger.exception("Unexpected error listing tools")
             raise
 
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a tool on the MCP server."""
         try:
-            logger.info(f"Calling tool '{tool_name}' with arguments: {arguments}")
+            logger.info("Calling tool '%s' with arguments: %s", tool_name, arguments)
             return await self._send_request(
                 "tools/call",
                 {"name": tool_name, "arguments": arguments},
                 2
             )
-        except Exception as e:
-            logger.error(f"Failed to call tool '{tool_name}': {e}")
+        except (httpx.HTTPError, MCPError) as e:
+            logger.error("Failed to call tool '%s': %s", tool_name, e)
+            raise
+        except Exception:
+            logger.exception("Unexpected error calling tool '%s'", tool_name)
             raise
 
     async def list_resources(self) -> List[Dict[str, Any]]:
         """List available resources from MCP server."""
         try:
-            result = await self._send_request("resources/list", {}, 3)
+            result = await self._send_request("resources/list", _EMPTY_PARAMS, 3)
             resources = result.get("resources", [])
-            logger.info(f"Retrieved {len(resources)} resources from MCP server")
+            logger.info("Retrieved %d resources from MCP server", len(resources))
             return resources
-        except Exception as e:
-            logger.error(f"Failed to list resources: {e}")
+        except (httpx.HTTPError, MCPError) as e:
+            logger.error("Failed to list resources: %s", e)
+            raise
+        except Exception:
+            logger.exception("Unexpected error listing resources")
             raise
 
     async def read_resource(self, uri: str) -> Dict[str, Any]:
         """Read a specific resource from MCP server."""
         try:
-            logger.info(f"Reading resource: {uri}")
+            logger.info("Reading resource: %s", uri)
             return await self._send_request("resources/read", {"uri": uri}, 4)
-        except Exception as e:
-            logger.error(f"Failed to read resource '{uri}': {e}")
+        except (httpx.HTTPError, MCPError) as e:
+            logger.error("Failed to read resource '%s': %s", uri, e)
+            raise
+        except Exception:
+            logger.exception("Unexpected error reading resource '%s'", uri)
             raise
 
 
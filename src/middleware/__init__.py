@@ -3,13 +3,17 @@
 from src.middleware.error_handler import (
     http_exception_handler,
     validation_exception_handler,
-    general_exception_handler,
+    mcp_error_handler,
+    httpx_timeout_handler,
+    httpx_error_handler,
 )
 from src.middleware.logging_middleware import RequestLoggingMiddleware
 
 __all__ = [
     "http_exception_handler",
     "validation_exception_handler",
-    "general_exception_handler",
+    "mcp_error_handler",
+    "httpx_timeout_handler",
+    "httpx_error_handler",
     "RequestLoggingMiddleware",
 ]
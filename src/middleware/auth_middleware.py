@@ -1,5 +1,6 @@
 """Authentication middleware for validation API keys."""
 
+import hmac
 from typing import Optional
 
 from fastapi import HTTPException, Security, status
@@ -10,21 +11,25 @@ from src.config import settings
 # Define API Key header scheme
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
+# Cached at import so every authenticated request skips a pydantic attribute lookup.
+_CONFIGURED_KEY = settings.bridge_api_key
+
 
 async def get_api_key(api_key_header: str = Security(api_key_header)) -> Optional[str]:
     """
     Validate the X-API-Key header against the configured secret.
-    
+
     If BRIDGE_API_KEY is not set in config, authentication is disabled (always valid).
     """
-    configured_key = settings.bridge_api_key
-    
+    configured_key = _CONFIGURED_KEY
+
     # If no key is configured, allow all requests (Dev mode)
     if not configured_key:
         return api_key_header
 
-    # If key is required but missing or invalid
-    if api_key_header == configured_key:
+    # Constant-time compare so key validation does not leak timing information.
+    # Compare bytes: compare_digest raises TypeError on non-ASCII str operands.
+    if hmac.compare_digest((api_key_header or "").encode(), configured_key.encode()):
         return api_key_header
         
     raise HTTPException(
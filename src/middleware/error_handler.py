@@ -2,11 +2,14 @@
 
 import logging
 from typing import Union
+import httpx
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from src.mcp_client import MCPError
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,16 +46,46 @@ async def validation_exception_handler(
     )
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
-    """Handle general exceptions."""
-    logger.error(f"Unhandled exception: {exc} - {request.url}", exc_info=True)
+async def mcp_error_handler(request: Request, exc: MCPError) -> JSONResponse:
+    """Handle JSON-RPC errors returned by the MCP server."""
+    logger.error(f"MCP error: {exc} - {request.url}")
+    return JSONResponse(
+        status_code=status.HTTP_502_BAD_GATEWAY,
+        content={
+            "error": {
+                "code": 502,
+                "message": str(exc),
+                "type": "mcp_error",
+            }
+        },
+    )
+
+
+async def httpx_timeout_handler(request: Request, exc: httpx.TimeoutException) -> JSONResponse:
+    """Handle timeouts talking to the MCP server."""
+    logger.error(f"MCP server timeout: {exc} - {request.url}")
+    return JSONResponse(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        content={
+            "error": {
+                "code": 504,
+                "message": "MCP server timed out",
+                "type": "upstream_timeout",
+            }
+        },
+    )
+
+
+async def httpx_error_handler(request: Request, exc: httpx.HTTPError) -> JSONResponse:
+    """Handle transport and protocol errors talking to the MCP server."""
+    logger.error(f"MCP server communication error: {exc} - {request.url}")
     return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        status_code=status.HTTP_502_BAD_GATEWAY,
         content={
             "error": {
-                "code": 500,
-                "message": "Internal server error",
-                "type": "server_error",
+                "code": 502,
+                "message": "Failed to communicate with MCP server",
+                "type": "upstream_error",
             }
         },
     )
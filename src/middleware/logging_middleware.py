@@ -1,10 +1,11 @@
 """Middleware for logging full request and response payloads."""
 
-import json
+import itertools
 import logging
 import time
 from typing import Callable
 
+import orjson
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import Message
@@ -13,17 +14,34 @@ from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Cached at import so the hot path skips a pydantic attribute lookup per request.
+_LOG_PAYLOADS = settings.bridge_log_payloads
+
+# Noisy or secret-bearing headers excluded from audit logs
+_REDACTED_HEADERS = frozenset({"authorization", "cookie", "x-api-key"})
+
+# Monotonic per-process request sequence; cheaper than a wall-clock read
+_req_seq = itertools.count(1)
+
+
+def _replay_receive(body: bytes) -> Callable:
+    """Build a receive callable that replays an already-consumed request body."""
+    async def receive() -> Message:
+        return {"type": "http.request", "body": body}
+
+    return receive
+
 
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """Middleware to log detailed request and response information."""
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """Process the request and log its details."""
-        if not settings.bridge_log_payloads:
+        if not _LOG_PAYLOADS or not logger.isEnabledFor(logging.INFO):
             return await call_next(request)
 
         # Log request details
-        request_id = f"{time.time():.3f}"
+        request_id = next(_req_seq)
         path = request.url.path
         method = request.method
         
@@ -31,39 +49,54 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         body = await request.body()
         
         # We need to replace the request body because it's been consumed
-        async def receive() -> Message:
-            return {"type": "http.request", "body": body}
-        
-        request._receive = receive
+        request._receive = _replay_receive(body)
 
         try:
-            body_json = json.loads(body) if body else {}
-            payload_log = json.dumps(body_json, indent=2)
-        except json.JSONDecodeError:
+            body_json = orjson.loads(body) if body else {}
+            payload_log = orjson.dumps(body_json, option=orjson.OPT_INDENT_2).decode()
+        except orjson.JSONDecodeError:
             payload_log = body.decode("utf-8", errors="replace") if body else "<Empty body>"
 
+        # Render headers without materializing an intermediate dict,
+        # skipping secret-bearing ones (header keys are lowercase in Starlette)
+        headers_log = "\n".join(
+            f"  {key}: {value}"
+            for key, value in request.headers.items()
+            if key not in _REDACTED_HEADERS
+        )
+
         logger.info(
             f"[AUDIT] [{request_id}] Incoming {method} {path}\n"
-            f"Headers: {dict(request.headers)}\n"
+            f"Headers:\n{headers_log}\n"
             f"Payload: {payload_log}"
         )
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         response = await call_next(request)
-        duration = time.time() - start_time
-
-        # Capture response body for certain content types
-        response_body = b""
+        duration = time.perf_counter() - start_time
+
+        # Only buffer JSON responses; streaming or binary bodies pass through untouched
+        content_type = response.headers.get("content-type", "")
+        if not content_type.startswith("application/json"):
+            logger.info(
+                f"[AUDIT] [{request_id}] Outgoing {method} {path} - Status: {response.status_code} - Duration: {duration:.3f}s\n"
+                f"Response Payload: <skipped: {content_type or 'no content-type'}>"
+            )
+            return response
+
+        # Collect chunks and join once to avoid quadratic bytes concatenation
+        chunks = []
         async for chunk in response.body_iterator:
-            response_body += chunk
+            chunks.append(chunk)
+        response_body = b"".join(chunks)
 
         # Replace the response body iterator
         response.body_iterator = iterate_in_chunks(response_body)
 
         try:
-            resp_json = json.loads(response_body) if response_body else {}
-            resp_log = json.dumps(resp_json, indent=2) if isinstance(resp_json, dict) else str(resp_json)
-        except json.JSONDecodeError:
+            resp_json = orjson.loads(response_body) if response_body else {}
+            resp_log = orjson.dumps(resp_json, option=orjson.OPT_INDENT_2).decode() if isinstance(resp_json, dict) else str(resp_json)
+        except orjson.JSONDecodeError:
             resp_log = response_body.decode("utf-8", errors="replace") if response_body else "<Empty body>"
 
         logger.info(
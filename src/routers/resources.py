@@ -1,9 +1,9 @@
 """FastAPI router for MCP resources endpoints."""
 
 import logging
-from typing import Any, Dict, List, Optional
-from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel, Field
+from typing import List, Optional
+import msgspec
+from fastapi import APIRouter, Response
 
 from src.mcp_client import mcp_client
 
@@ -12,8 +12,10 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/resources", tags=["resources"])
 
 
-class ResourceInfo(BaseModel):
-    """Resource information model."""
+# Internal response shapes as msgspec Structs: C-accelerated conversion and
+# encoding without the Pydantic validator pipeline
+class ResourceInfo(msgspec.Struct):
+    """Resource information shape."""
 
     uri: str
     name: str
@@ -21,14 +23,14 @@ class ResourceInfo(BaseModel):
     mimeType: Optional[str] = None
 
 
-class ResourceListResponse(BaseModel):
-    """Response model for resource listing."""
+class ResourceListResponse(msgspec.Struct):
+    """Response shape for resource listing."""
 
     resources: List[ResourceInfo]
 
 
-class ResourceContent(BaseModel):
-    """Resource content model."""
+class ResourceContent(msgspec.Struct):
+    """Resource content shape."""
 
     uri: str
     mimeType: Optional[str] = None
@@ -36,33 +38,30 @@ class ResourceContent(BaseModel):
     blob: Optional[str] = None
 
 
-class ResourceReadResponse(BaseModel):
-    """Response model for resource reading."""
+class ResourceReadResponse(msgspec.Struct):
+    """Response shape for resource reading."""
 
     contents: List[ResourceContent]
 
 
-@router.get("", response_model=ResourceListResponse)
-async def list_resources() -> ResourceListResponse:
+@router.get("", response_model=None)
+async def list_resources() -> Response:
     """
     List all available resources from the Splunk MCP Server.
 
     Returns:
-        ResourceListResponse: List of available resources
+        Response: Pre-encoded JSON list of available resources
+
+    Upstream failures (httpx errors, MCPError) propagate to the app-level
+    exception handlers, which map them to 502/504 JSON responses.
     """
-    try:
-        resources = await mcp_client.list_resources()
-        return ResourceListResponse(resources=resources)
-    except Exception as e:
-        logger.error(f"Failed to list resources: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Failed to communicate with MCP server: {str(e)}",
-        )
-
-
-@router.get("/{uri:path}", response_model=ResourceReadResponse)
-async def read_resource(uri: str) -> ResourceReadResponse:
+    resources = await mcp_client.list_resources()
+    payload = msgspec.convert({"resources": resources}, type=ResourceListResponse)
+    return Response(content=msgspec.json.encode(payload), media_type="application/json")
+
+
+@router.get("/{uri:path}", response_model=None)
+async def read_resource(uri: str) -> Response:
     """
     Read a specific resource from the Splunk MCP Server.
 
@@ -70,19 +69,14 @@ async def read_resource(uri: str) -> ResourceReadResponse:
         uri: URI of the resource to read
 
     Returns:
-        ResourceReadResponse: Content of the resource
+        Response: Pre-encoded JSON content of the resource
+
+    Upstream failures (httpx errors, MCPError) propagate to the app-level
+    exception handlers, which map them to 502/504 JSON responses.
     """
-    try:
-        logger.info(f"Reading resource: {uri}")
-        result = await mcp_client.read_resource(uri)
-        
-        # Extract contents from MCP result
-        contents = result.get("contents", [])
-        
-        return ResourceReadResponse(contents=contents)
-    except Exception as e:
-        logger.error(f"Failed to read resource '{uri}': {e}")
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Failed to read resource from MCP server: {str(e)}",
-        )
+    logger.info("Reading resource: %s", uri)
+    result = await mcp_client.read_resource(uri)
+
+    # Extract contents from MCP result
+    payload = msgspec.convert({"contents": result.get("contents", [])}, type=ResourceReadResponse)
+    return Response(content=msgspec.json.encode(payload), media_type="application/json")
@@ -2,7 +2,8 @@
 
 import logging
 from typing import Any, Dict, List
-from fastapi import APIRouter, HTTPException, status
+import msgspec
+from fastapi import APIRouter, Response
 from pydantic import BaseModel, Field
 
 from src.mcp_client import mcp_client
@@ -13,7 +14,7 @@ router = APIRouter(prefix="/api/tools", tags=["tools"])
 
 
 class ToolExecutionRequest(BaseModel):
-    """Request model for tool execution."""
+    """Request model for tool execution (Pydantic: validates untrusted client input)."""
 
     arguments: Dict[str, Any] = Field(
         default_factory=dict,
@@ -21,51 +22,50 @@ class ToolExecutionRequest(BaseModel):
     )
 
 
-class ToolInfo(BaseModel):
-    """Tool information model."""
+# Internal response shapes as msgspec Structs: C-accelerated conversion and
+# encoding without the Pydantic validator pipeline
+class ToolInfo(msgspec.Struct):
+    """Tool information shape."""
 
     name: str
     description: str
     inputSchema: Dict[str, Any]
 
 
-class ToolListResponse(BaseModel):
-    """Response model for tool listing."""
+class ToolListResponse(msgspec.Struct):
+    """Response shape for tool listing."""
 
     tools: List[ToolInfo]
 
 
-class ToolExecutionResponse(BaseModel):
-    """Response model for tool execution."""
+class ToolExecutionResponse(msgspec.Struct):
+    """Response shape for tool execution."""
 
     content: List[Dict[str, Any]]
     isError: bool = False
 
 
-@router.get("", response_model=ToolListResponse)
-async def list_tools() -> ToolListResponse:
+@router.get("", response_model=None)
+async def list_tools() -> Response:
     """
     List all available tools from the Splunk MCP Server.
 
     Returns:
-        ToolListResponse: List of available tools with their schemas
+        Response: Pre-encoded JSON list of available tools with their schemas
+
+    Upstream failures (httpx errors, MCPError) propagate to the app-level
+    exception handlers, which map them to 502/504 JSON responses.
     """
-    try:
-        tools = await mcp_client.list_tools()
-        return ToolListResponse(tools=tools)
-    except Exception as e:
-        logger.error(f"Failed to list tools: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Failed to communicate with MCP server: {str(e)}",
-        )
-
-
-@router.post("/{tool_name}", response_model=ToolExecutionResponse)
+    tools = await mcp_client.list_tools()
+    payload = msgspec.convert({"tools": tools}, type=ToolListResponse)
+    return Response(content=msgspec.json.encode(payload), media_type="application/json")
+
+
+@router.post("/{tool_name}", response_model=None)
 async def execute_tool(
     tool_name: str,
     request: ToolExecutionRequest,
-) -> ToolExecutionResponse:
+) -> Response:
     """
     Execute a specific tool on the Splunk MCP Server.
 
@@ -74,20 +74,17 @@ async def execute_tool(
         request: Tool execution request with arguments
 
     Returns:
-        ToolExecutionResponse: Result of the tool execution
+        Response: Pre-encoded JSON result of the tool execution
+
+    Upstream failures (httpx errors, MCPError) propagate to the app-level
+    exception handlers, which map them to 502/504 JSON responses.
     """
-    try:
-        logger.info(f"Executing tool '{tool_name}' with arguments: {request.arguments}")
-        result = await mcp_client.call_tool(tool_name, request.arguments)
-        
-        # Extract content and error status from MCP result
-        content = result.get("content", [])
-        is_error = result.get("isError", False)
-        
-        return ToolExecutionResponse(content=content, isError=is_error)
-    except Exception as e:
-        logger.error(f"Failed to execute tool '{tool_name}': {e}")
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Failed to execute tool on MCP server: {str(e)}",
-        )
+    logger.info("Executing tool '%s' with arguments: %s", tool_name, request.arguments)
+    result = await mcp_client.call_tool(tool_name, request.arguments)
+
+    # Extract content and error status from MCP result
+    payload = ToolExecutionResponse(
+        content=result.get("content", []),
+        isError=result.get("isError", False),
+    )
+    return Response(content=msgspec.json.encode(payload), media_type="application/json")